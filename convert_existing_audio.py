@@ -4,29 +4,79 @@ Convert existing WAV audio files to compressed MP3 format to save space.
 """
 
 import os
+import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+# Resolved once so each conversion skips the PATH search
+FFMPEG = shutil.which('ffmpeg') or 'ffmpeg'
 
 def convert_wav_to_mp3(wav_file: str, mp3_file: str) -> bool:
     """Convert WAV file to compressed MP3 using ffmpeg."""
-    cmd = [
-        'ffmpeg', '-i', wav_file,
+    cmd = (
+        FFMPEG, '-nostats', '-loglevel', 'error',  # Only errors on stderr
+        '-i', wav_file,
         '-acodec', 'libmp3lame',
         '-ab', '32k',  # 32kbps bitrate for speech
         '-ar', '16000',  # 16kHz sample rate
         '-y',  # Overwrite output file
         mp3_file
-    ]
+    )
+    
+    # stderr goes to a temp file rather than a pipe: it is only read and decoded if
+    # the conversion fails, and a chatty ffmpeg can never stall on a full pipe
+    with tempfile.TemporaryFile() as stderr:
+        try:
+            # Python creates fds non-inheritable (PEP 446), so skipping the
+            # close_fds sweep in the child is safe
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=stderr, check=True,
+                           close_fds=False)
+            return True
+        except subprocess.CalledProcessError:
+            stderr.seek(0)
+            print(f"Error converting {wav_file}: {stderr.read().decode('utf-8', errors='replace')}")
+            return False
+        except FileNotFoundError:
+            print("Error: ffmpeg not found. Please install ffmpeg.")
+            return False
+
+def convert_wav_to_mp3_pair(job: Tuple[str, str, int]) -> Tuple[str, int, Optional[int]]:
+    """
+    Worker for the conversion pool: convert one WAV and delete it on success.
+    
+    Returns:
+        (wav_file, original_size, new_size) - new_size is None if conversion failed
+    """
+    wav_file, mp3_file, original_size = job
+    if not convert_wav_to_mp3(wav_file, mp3_file):
+        return wav_file, original_size, None
+    
+    new_size = os.stat(mp3_file).st_size
+    # Delete original WAV file
+    os.unlink(wav_file)
+    return wav_file, original_size, new_size
+
+def walk_wavs(root: str) -> Iterator[Tuple[str, int]]:
+    """
+    Recursively yield (path, size) for every WAV file under root.
     
+    Uses os.scandir so directory type checks come from the directory listing
+    and each file is stat'ed exactly once.
+    """
     try:
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error converting {wav_file}: {e.stderr}")
-        return False
-    except FileNotFoundError:
-        print("Error: ffmpeg not found. Please install ffmpeg.")
-        return False
+        entries = os.scandir(root)
+    except OSError:
+        # Skip unreadable directories, as Path.rglob does
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk_wavs(entry.path)
+            elif entry.name.endswith('.wav') and entry.is_file():
+                yield entry.path, entry.stat().st_size
 
 def main():
     videos_dir = Path("videos")
@@ -35,42 +85,41 @@ def main():
         print("videos/ directory not found!")
         return
     
-    wav_files = list(videos_dir.rglob("*.wav"))
+    jobs = [
+        (wav_file, os.path.splitext(wav_file)[0] + '.mp3', original_size)
+        for wav_file, original_size in walk_wavs(str(videos_dir))
+    ]
     
-    if not wav_files:
+    if not jobs:
         print("No WAV files found to convert.")
         return
     
-    print(f"Found {len(wav_files)} WAV file(s) to convert...\n")
+    # Each ffmpeg encode is single-threaded, so run one per core
+    workers = min(len(jobs), os.cpu_count() or 1)
+    print(f"Found {len(jobs)} WAV file(s) to convert ({workers} parallel job(s))...\n")
     
     total_saved = 0
-    for wav_file in wav_files:
-        mp3_file = wav_file.with_suffix('.mp3')
-        
-        # Get original size
-        original_size = wav_file.stat().st_size
-        
-        print(f"Converting: {wav_file.name}")
-        print(f"  Original size: {original_size / (1024*1024):.1f} MB")
-        
-        if convert_wav_to_mp3(str(wav_file), str(mp3_file)):
-            # Get new size
-            new_size = mp3_file.stat().st_size
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(convert_wav_to_mp3_pair, job) for job in jobs]
+        for done, future in enumerate(as_completed(futures), start=1):
+            wav_file, original_size, new_size = future.result()
+            
+            print(f"[{done}/{len(jobs)}] {Path(wav_file).name}")
+            print(f"  Original size: {original_size / (1024*1024):.1f} MB")
+            
+            if new_size is None:
+                print(f"  ✗ Conversion failed\n")
+                continue
+            
             saved = original_size - new_size
             total_saved += saved
             
             print(f"  New size: {new_size / (1024*1024):.1f} MB")
-            print(f"  Space saved: {saved / (1024*1024):.1f} MB ({saved/original_size*100:.1f}%)\n")
-            
-            # Delete original WAV file
-            wav_file.unlink()
+            print(f"  Space saved: {saved / (1024*1024):.1f} MB ({saved/original_size*100:.1f}%)")
             print(f"  ✓ Deleted original WAV file\n")
-        else:
-            print(f"  ✗ Conversion failed\n")
     
     print(f"\n✅ Conversion complete!")
     print(f"Total space saved: {total_saved / (1024*1024):.1f} MB")
 
 if __name__ == "__main__":
     main()
-
@@ -5,14 +5,21 @@ YouTube Video Processor: Downloads video, removes silence, transcribes, and summ
 
 import os
 import sys
+import importlib.util
+import io
 import json
 import re
 import shutil
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, Iterable, Sequence
 import subprocess
+import queue
+import threading
 try:
     import yt_dlp
+    from yt_dlp.postprocessor import PostProcessor
 except ImportError as e:
     print(f"Error: Missing required package. Please install dependencies: pip install -r requirements.txt")
     print(f"Missing: {e}")
@@ -27,29 +34,80 @@ try:
 except ImportError:
     PYDUB_AVAILABLE = False
 
-# Try to import whisper - make it optional
+# NumPy (installed alongside whisper) vectorizes the pydub fallback's silence detection
+NUMPY_AVAILABLE = False
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# PyAV (in requirements.txt) decodes audio in-process without spawning ffmpeg
+AV_AVAILABLE = False
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+
+# orjson speeds up checkpoint/transcription JSON I/O - falls back to stdlib json
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import whisper - make it optional. Backends in order of preference:
+# whisper.cpp (quantized GGML weights) > faster-whisper (CTranslate2) > openai-whisper
 WHISPER_AVAILABLE = False
 WHISPER_TYPE = None
 try:
-    import whisper
+    from pywhispercpp.model import Model as WhisperCppModel
     WHISPER_AVAILABLE = True
-    WHISPER_TYPE = "standard"
+    WHISPER_TYPE = "cpp"
 except ImportError:
     try:
         from faster_whisper import WhisperModel
         WHISPER_AVAILABLE = True
         WHISPER_TYPE = "faster"
     except ImportError:
-        WHISPER_AVAILABLE = False
-        WHISPER_TYPE = None
+        try:
+            import whisper
+            WHISPER_AVAILABLE = True
+            WHISPER_TYPE = "standard"
+        except ImportError:
+            WHISPER_AVAILABLE = False
+            WHISPER_TYPE = None
+
+# How silence is skipped, best first:
+#   "whisper_vad" - faster-whisper's built-in Silero VAD, no separate silence step
+#   "silero"      - standalone Silero VAD (the silero-vad package) picks speech to keep
+#   "ffmpeg"      - fixed-threshold silence removal fused into the download encode
+if WHISPER_TYPE == "faster":
+    SILENCE_BACKEND = "whisper_vad"
+elif importlib.util.find_spec("silero_vad") is not None and AV_AVAILABLE and NUMPY_AVAILABLE:
+    SILENCE_BACKEND = "silero"
+else:
+    SILENCE_BACKEND = "ffmpeg"
+
+# Silence removal settings shared by every backend, including the fused download filter
+MIN_SILENCE_LEN = 1000  # Minimum length of silence to split on (ms)
+SILENCE_THRESH = -40  # Silence threshold in dB
+KEEP_SILENCE = 200  # Amount of silence to keep at the beginning/end of chunks (ms)
+
+
+# Patterns used by sanitize_filename, compiled once for batch runs
+INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+WHITESPACE_RE = re.compile(r'\s+')
 
 
 def sanitize_filename(title: str) -> str:
     """Sanitize video title for use in filenames."""
     # Remove or replace invalid filename characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '', title)
+    sanitized = INVALID_FILENAME_CHARS_RE.sub('', title)
     # Replace spaces with underscores
-    sanitized = re.sub(r'\s+', '_', sanitized)
+    sanitized = WHITESPACE_RE.sub('_', sanitized)
     # Remove leading/trailing dots and spaces
     sanitized = sanitized.strip('. ')
     # Limit length to avoid filesystem issues
@@ -58,44 +116,261 @@ def sanitize_filename(title: str) -> str:
     return sanitized
 
 
-def download_video(url: str, output_dir: str = "downloads") -> Tuple[str, str]:
-    """Download YouTube video and extract audio."""
+def silenceremove_filter(silence_thresh: int = SILENCE_THRESH,
+                         keep_silence: int = KEEP_SILENCE) -> str:
+    """
+    ffmpeg silenceremove filter that drops leading silence and shortens every pause.
+    
+    silenceremove copies the first stop_duration of each pause before it trims, so
+    that is set to 2 * keep_silence (ms) with no extra stop_silence, matching the
+    keep_silence padding on both sides of a cut in remove_silence. Unlike
+    remove_silence there is no min_silence_len: pauses shorter than it are
+    shortened too.
+    """
+    return (
+        f'silenceremove=start_periods=1:start_threshold={silence_thresh}dB:'
+        f'stop_periods=-1:stop_duration={2 * keep_silence / 1000}:stop_threshold={silence_thresh}dB:'
+        f'stop_silence=0:detection=peak'
+    )
+
+
+class FusedAudioPP(PostProcessor):
+    """
+    yt-dlp postprocessor that turns the downloaded stream into the final speech MP3.
+    
+    One ffmpeg graph decodes the stream once, applies audio_filter and encodes with
+    libmp3lame, replacing FFmpegExtractAudio followed by a separate silence-removal
+    re-encode. If the filtered graph fails, falls back to a plain encode and leaves
+    silence_removed False so the caller can run remove_silence itself.
+    """
+    
+    def __init__(self, audio_filter: Optional[str] = None, downloader=None):
+        super().__init__(downloader)
+        self.audio_filter = audio_filter
+        self.output_file = None
+        self.silence_removed = False
+        self.original_duration = None
+    
+    def run(self, information):
+        source = information['filepath']
+        output_file = os.path.splitext(source)[0] + '.mp3'
+        # Encode under a temporary name so an .mp3 source is never overwritten while read
+        temp_file = os.path.splitext(source)[0] + '.fused.mp3'
+        self.original_duration = probe_duration(source) or information.get('duration')
+        
+        attempts = [self.audio_filter, None] if self.audio_filter else [None]
+        for audio_filter in attempts:
+            cmd = ['ffmpeg', '-i', source]
+            if audio_filter:
+                cmd += ['-af', audio_filter]
+            cmd += [
+                '-acodec', 'libmp3lame',
+                '-ab', '32k',  # 32kbps bitrate for speech (maximum space savings)
+                '-ar', '16000',  # Lower sample rate for speech (saves more space)
+                '-y',  # Overwrite output file
+                temp_file
+            ]
+            try:
+                subprocess.run(cmd, capture_output=True, text=True, check=True)
+                break
+            except subprocess.CalledProcessError as e:
+                print(f"⚠️  FFmpeg audio conversion failed: {e.stderr}")
+            except FileNotFoundError:
+                raise yt_dlp.utils.PostProcessingError("ffmpeg not found. Install ffmpeg: brew install ffmpeg")
+        else:
+            raise yt_dlp.utils.PostProcessingError(f"Could not convert {source} to MP3")
+        
+        os.replace(temp_file, output_file)
+        self.output_file = output_file
+        self.silence_removed = audio_filter is not None
+        information['filepath'] = output_file
+        information['ext'] = 'mp3'
+        return ([] if source == output_file else [source]), information
+
+
+def download_video(url: str, output_dir: str = "downloads",
+                   fuse_silence_removal: bool = True) -> Tuple[str, str, bool]:
+    """
+    Download YouTube video and extract audio.
+    
+    With fuse_silence_removal, silence is removed in the same ffmpeg pass that
+    encodes the download to MP3.
+    
+    Returns:
+        (audio_file, title, silence_removed)
+    """
     Path(output_dir).mkdir(exist_ok=True)
     
     ydl_opts = {
         'format': 'bestaudio/best',
         'outtmpl': os.path.join(output_dir, '%(title)s.%(ext)s'),
-        'postprocessors': [{
-            'key': 'FFmpegExtractAudio',
-            'preferredcodec': 'mp3',
-            'preferredquality': '32',  # 32kbps for speech - maximum space savings
-        }],
         'quiet': True,
         'no_warnings': True,
     }
+    audio_pp = FusedAudioPP(silenceremove_filter(SILENCE_THRESH, KEEP_SILENCE)
+                            if fuse_silence_removal else None)
     
     print(f"Downloading video from {url}...")
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        ydl.add_post_processor(audio_pp, when='post_process')
         info = ydl.extract_info(url, download=True)
         title = info.get('title', 'video')
-        filename = ydl.prepare_filename(info)
         # Replace extension with mp3
-        audio_file = os.path.splitext(filename)[0] + '.mp3'
+        audio_file = audio_pp.output_file or os.path.splitext(ydl.prepare_filename(info))[0] + '.mp3'
     
     # Verify file exists
     if not os.path.exists(audio_file):
         raise FileNotFoundError(f"Audio file not found after download: {audio_file}")
     
     print(f"Downloaded: {audio_file}")
-    return audio_file, title
+    if audio_pp.silence_removed:
+        print("Silence removed during download")
+        original = audio_pp.original_duration
+        processed = probe_duration(audio_file)
+        if original is not None and processed is not None:
+            print(f"Original duration: {original:.1f}s")
+            print(f"After silence removal: {processed:.1f}s")
+            if original > 0:
+                reduction_pct = ((original - processed) / original) * 100
+                print(f"Reduction: {reduction_pct:.1f}%")
+            else:
+                print("Reduction: 0.0%")
+    return audio_file, title, audio_pp.silence_removed
+
+
+# Patterns for parsing ffmpeg's silencedetect output on stderr
+SILENCE_EVENT_RE = re.compile(r'silence_(start|end): (-?[\d.]+)')
+DURATION_RE = re.compile(r'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)')
+
+
+def probe_duration(audio_file: str) -> Optional[float]:
+    """Return an audio file's duration in seconds from its header, or None if unknown."""
+    if AV_AVAILABLE:
+        try:
+            with av.open(audio_file) as container:
+                if container.duration is not None:
+                    return container.duration / av.time_base
+        except Exception:
+            pass
+    try:
+        # With no output file ffmpeg exits non-zero, but still prints the header
+        result = subprocess.run(['ffmpeg', '-i', audio_file], capture_output=True, text=True)
+    except OSError:
+        return None
+    match = DURATION_RE.search(result.stderr)
+    if not match:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def detect_silence_ffmpeg(audio_file: str, min_silence_len: int,
+                          silence_thresh: int) -> Tuple[list[tuple[float, float]], float]:
+    """
+    Find silent ranges with ffmpeg's silencedetect filter (streams, no decode into RAM).
+    
+    Returns:
+        (silent ranges as (start, end) seconds, total duration in seconds)
+    """
+    cmd = [
+        'ffmpeg', '-i', audio_file,
+        '-af', f'silencedetect=noise={silence_thresh}dB:d={min_silence_len/1000}',
+        '-f', 'null', '-'
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    
+    duration = 0.0
+    match = DURATION_RE.search(result.stderr)
+    if match:
+        h, m, s = match.groups()
+        duration = int(h) * 3600 + int(m) * 60 + float(s)
+    
+    silences = []
+    silence_start = None
+    for kind, value in SILENCE_EVENT_RE.findall(result.stderr):
+        if kind == 'start':
+            silence_start = max(float(value), 0.0)
+        elif silence_start is not None:
+            silences.append((silence_start, float(value)))
+            silence_start = None
+    # Silence running to the end of the file has no silence_end line
+    if silence_start is not None:
+        silences.append((silence_start, max(duration, silence_start)))
+    
+    if silences:
+        duration = max(duration, silences[-1][1])
+    return silences, duration
+
+
+def nonsilent_intervals(silences: list[tuple[float, float]], duration: float,
+                        keep_silence: int) -> list[tuple[float, float]]:
+    """Invert silent ranges into non-silent ones, padded by keep_silence (ms) and merged."""
+    pad = keep_silence / 1000
+    intervals = []
+    position = 0.0
+    for start, end in silences:
+        if start > position:
+            intervals.append((max(position - pad, 0.0), min(start + pad, duration)))
+        position = max(position, end)
+    if position < duration:
+        intervals.append((max(position - pad, 0.0), duration))
+    
+    # Padding can make neighbours overlap; merge so every instant is selected once
+    merged = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+@lru_cache(maxsize=1)
+def _get_silero_vad():
+    """Load the Silero VAD model (~2 MB, bundled with the silero-vad package) once per process."""
+    from silero_vad import load_silero_vad
+    return load_silero_vad()
+
+
+def detect_speech_silero(audio_file: str, min_silence_len: int,
+                         keep_silence: int) -> Optional[Tuple[list[tuple[float, float]], float]]:
+    """
+    Find speech with Silero VAD, which keeps quiet speech that a fixed dB threshold drops.
+    
+    Returns:
+        (speech ranges as (start, end) seconds, total duration in seconds), or None
+        if Silero could not be loaded or run
+    """
+    try:
+        import torch
+        from silero_vad import get_speech_timestamps
+        model = _get_silero_vad()
+        print("Detecting speech with Silero VAD...")
+        samples = decode_audio(audio_file)
+        timestamps = get_speech_timestamps(
+            torch.from_numpy(samples), model,
+            sampling_rate=WHISPER_SAMPLE_RATE,
+            min_silence_duration_ms=min_silence_len,
+            speech_pad_ms=keep_silence,
+        )
+    except Exception as e:
+        print(f"⚠️  Silero VAD unavailable ({e}), falling back to ffmpeg silencedetect")
+        return None
+    
+    intervals = [(t['start'] / WHISPER_SAMPLE_RATE, t['end'] / WHISPER_SAMPLE_RATE) for t in timestamps]
+    return intervals, len(samples) / WHISPER_SAMPLE_RATE
 
 
 def remove_silence(audio_file: str, output_file: str, 
-                   min_silence_len: int = 1000, 
-                   silence_thresh: int = -40,
-                   keep_silence: int = 200) -> str:
+                   min_silence_len: int = MIN_SILENCE_LEN, 
+                   silence_thresh: int = SILENCE_THRESH,
+                   keep_silence: int = KEEP_SILENCE) -> str:
     """
-    Remove silence from audio file using ffmpeg or pydub.
+    Remove silence from audio file using Silero VAD or ffmpeg (pydub as a last resort).
+    
+    Speech is located with Silero VAD when SILENCE_BACKEND is "silero", otherwise
+    with a streaming ffmpeg silencedetect pass. A single aselect + libmp3lame
+    encode then keeps only those ranges.
     
     Args:
         audio_file: Input audio file path
@@ -104,146 +379,562 @@ def remove_silence(audio_file: str, output_file: str,
         silence_thresh: Silence threshold in dB
         keep_silence: Amount of silence to keep at the beginning/end of chunks (ms)
     """
-    if PYDUB_AVAILABLE:
-        print("Loading audio file...")
-        # Support both wav and mp3 input
-        if audio_file.endswith('.mp3'):
-            audio = AudioSegment.from_mp3(audio_file)
+    # An earlier fallback may have hardlinked output_file to audio_file; never write through it
+    if os.path.exists(output_file) and os.path.samefile(audio_file, output_file):
+        os.remove(output_file)
+    
+    try:
+        speech = None
+        if SILENCE_BACKEND == "silero":
+            speech = detect_speech_silero(audio_file, min_silence_len, keep_silence)
+        if speech is not None:
+            intervals, duration = speech
         else:
-            audio = AudioSegment.from_wav(audio_file)
-        
-        print("Removing silence...")
-        # Split on silence
-        chunks = split_on_silence(
-            audio,
-            min_silence_len=min_silence_len,
-            silence_thresh=silence_thresh,
-            keep_silence=keep_silence
-        )
+            print("Detecting silence with ffmpeg...")
+            silences, duration = detect_silence_ffmpeg(audio_file, min_silence_len, silence_thresh)
+            intervals = nonsilent_intervals(silences, duration, keep_silence)
         
-        if not chunks:
+        if not intervals:
             print("No audio chunks found. Using original audio.")
-            # Export as MP3 with very low bitrate to save space (32kbps for speech)
-            audio.export(output_file, format="mp3", bitrate="32k")
-            return output_file
         
-        # Combine all non-silent chunks
-        combined = AudioSegment.empty()
-        for chunk in chunks:
-            combined += chunk
+        print("Removing silence...")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cmd = ['ffmpeg', '-i', audio_file]
+            if intervals and intervals != [(0.0, duration)]:
+                # The filtergraph grows with the number of ranges, so it goes in a
+                # script file rather than one argv element (capped at 128 KiB on Linux)
+                filter_script = os.path.join(tmp_dir, "filter.txt")
+                with open(filter_script, "w", encoding="utf-8") as f:
+                    f.write(f"aselect='{select_expression(intervals)}',asetpts=N/SR/TB")
+                cmd += ['-filter_script:a', filter_script]
+            # Use MP3 format with very low bitrate (32kbps) to save space
+            cmd += [
+                '-acodec', 'libmp3lame',
+                '-ab', '32k',  # 32kbps bitrate for speech (maximum space savings)
+                '-ar', '16000',  # Lower sample rate for speech (saves more space)
+                '-y',  # Overwrite output file
+                output_file
+            ]
+            subprocess.run(cmd, capture_output=True, text=True, check=True)
         
-        original_duration = len(audio) / 1000
-        processed_duration = len(combined) / 1000
-        print(f"Original duration: {original_duration:.1f}s")
+        processed_duration = sum(end - start for start, end in intervals) if intervals else duration
+        print(f"Original duration: {duration:.1f}s")
         print(f"After silence removal: {processed_duration:.1f}s")
-        if len(audio) > 0:
-            reduction_pct = ((len(audio) - len(combined)) / len(audio)) * 100
+        if duration > 0:
+            reduction_pct = ((duration - processed_duration) / duration) * 100
             print(f"Reduction: {reduction_pct:.1f}%")
         else:
             print("Reduction: 0.0%")
-        
-        # Export as MP3 with very low bitrate (32kbps) to save space
-        combined.export(output_file, format="mp3", bitrate="32k")
         print(f"Saved processed audio to: {output_file}")
         return output_file
+    except subprocess.CalledProcessError as e:
+        print(f"⚠️  FFmpeg silence removal failed: {e.stderr}")
+    except FileNotFoundError:
+        print("⚠️  FFmpeg not found.")
+        print("   Install ffmpeg: brew install ffmpeg")
+    except OSError as e:
+        print(f"⚠️  FFmpeg silence removal failed: {e}")
+    
+    if PYDUB_AVAILABLE:
+        try:
+            print("   Falling back to pydub...")
+            return _remove_silence_pydub(audio_file, output_file,
+                                         min_silence_len, silence_thresh, keep_silence)
+        except Exception as e:
+            print(f"⚠️  Pydub silence removal failed: {e}")
+    
+    print("   Copying original audio file...")
+    copy_audio_file(audio_file, output_file)
+    return output_file
+
+
+def select_expression(intervals: list[tuple[float, float]]) -> str:
+    """
+    Build an aselect expression that is true inside any of the sorted, disjoint intervals.
+    
+    The intervals are nested as a binary search over their start times, so ffmpeg
+    evaluates O(log n) terms per audio frame instead of one between() per interval.
+    """
+    def build(lo: int, hi: int) -> str:
+        if hi - lo == 1:
+            start, end = intervals[lo]
+            return f'between(t,{start:.3f},{end:.3f})'
+        mid = (lo + hi) // 2
+        return f'if(lt(t,{intervals[mid][0]:.3f}),{build(lo, mid)},{build(mid, hi)})'
+    
+    return build(0, len(intervals))
+
+
+def concat_manifest_entry(path: str) -> str:
+    """Return a 'file' line for an ffmpeg concat demuxer manifest, quoting path safely."""
+    escaped = os.path.abspath(path).replace("'", "'\\''")
+    return f"file '{escaped}'\n"
+
+
+def copy_audio_file(source: str, destination: str):
+    """
+    Copy a file as cheaply as the filesystem allows.
+    
+    Tries a hardlink, then a copy-on-write clone (cp --reflink on Linux, clonefile
+    on macOS), then a regular shutil.copy2. Each tier falls through to the next
+    on any failure.
+    """
+    if os.path.lexists(destination):
+        os.remove(destination)
+    
+    try:
+        os.link(source, destination)
+        return
+    except OSError:
+        pass
+    
+    if sys.platform.startswith("linux"):
+        try:
+            # --reflink=auto clones on btrfs/XFS and degrades to a normal copy elsewhere
+            subprocess.run(['cp', '--reflink=auto', source, destination],
+                           capture_output=True, check=True)
+            return
+        except (OSError, subprocess.CalledProcessError):
+            pass
+    elif sys.platform == "darwin":
+        try:
+            import ctypes
+            import ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            if libc.clonefile(os.fsencode(source), os.fsencode(destination), 0) == 0:
+                return
+        except (OSError, AttributeError):
+            pass
+    
+    shutil.copy2(source, destination)
+
+
+def fast_detect_nonsilent(audio: "AudioSegment", min_silence_len: int = 1000,
+                          silence_thresh: int = -16, seek_step: int = 1) -> list[list[int]]:
+    """
+    NumPy equivalent of pydub.silence.detect_nonsilent.
+    
+    pydub recomputes the RMS of every overlapping min_silence_len window from scratch.
+    Here squared samples are summed once per millisecond, and each window's energy is
+    a difference of two cumulative sums.
+    
+    Returns:
+        List of [start, end] non-silent ranges in milliseconds
+    """
+    seg_len = len(audio)
+    if seg_len < min_silence_len:
+        return [[0, seg_len]]
+    
+    dtype = {1: np.int8, 2: np.int16, 4: np.int32}[audio.sample_width]
+    samples = np.frombuffer(audio.raw_data, dtype=dtype)
+    # Sample offset of every millisecond boundary, matching AudioSegment slicing
+    bounds = (np.arange(seg_len + 1) * (audio.frame_rate / 1000.0)).astype(np.int64)
+    bounds = np.minimum(bounds * audio.channels, samples.size)
+    
+    # Per-millisecond sum of squares, in blocks to bound the float64 scratch memory
+    energy = np.empty(seg_len, dtype=np.float64)
+    block = 60_000
+    for m0 in range(0, seg_len, block):
+        m1 = min(m0 + block, seg_len)
+        chunk = samples[bounds[m0]:bounds[m1]].astype(np.float64)
+        csum = np.concatenate(([0.0], np.cumsum(chunk * chunk)))
+        rel = bounds[m0:m1 + 1] - bounds[m0]
+        energy[m0:m1] = csum[rel[1:]] - csum[rel[:-1]]
+    csum = np.concatenate(([0.0], np.cumsum(energy)))
+    
+    # Mean square of each candidate window, compared against the squared threshold
+    last_start = seg_len - min_silence_len
+    starts = np.arange(0, last_start + 1, seek_step)
+    if last_start % seek_step:
+        starts = np.append(starts, last_start)
+    ends = starts + min_silence_len
+    counts = np.maximum(bounds[ends] - bounds[starts], 1)
+    mean_square = (csum[ends] - csum[starts]) / counts
+    threshold = (10 ** (silence_thresh / 20)) * audio.max_possible_amplitude
+    silence_starts = starts[mean_square <= threshold * threshold]
+    
+    if silence_starts.size == 0:
+        return [[0, seg_len]]
+    
+    # Merge silent windows into ranges exactly like pydub.silence.detect_silence
+    gaps = np.diff(silence_starts)
+    breaks = np.flatnonzero((gaps != seek_step) & (gaps > min_silence_len))
+    range_starts = np.concatenate(([silence_starts[0]], silence_starts[breaks + 1]))
+    range_ends = np.concatenate((silence_starts[breaks], [silence_starts[-1]])) + min_silence_len
+    silent_ranges = list(zip(range_starts.tolist(), range_ends.tolist()))
+    
+    if silent_ranges[0] == (0, seg_len):
+        return []
+    
+    nonsilent_ranges = []
+    prev_end = 0
+    for start, end in silent_ranges:
+        nonsilent_ranges.append([prev_end, start])
+        prev_end = end
+    if prev_end != seg_len:
+        nonsilent_ranges.append([prev_end, seg_len])
+    if nonsilent_ranges[0] == [0, 0]:
+        nonsilent_ranges.pop(0)
+    return nonsilent_ranges
+
+
+def load_audio_segment(audio_file: str) -> "AudioSegment":
+    """
+    Load audio into a pydub AudioSegment.
+    
+    Decodes in-process with PyAV straight into 16-bit PCM when available, instead of
+    pydub spawning ffmpeg and buffering its whole output. Falls back to pydub's
+    own loaders otherwise.
+    """
+    if AV_AVAILABLE and NUMPY_AVAILABLE:
+        try:
+            with av.open(audio_file) as container:
+                stream = container.streams.audio[0]
+                rate, channels = stream.rate, stream.channels
+            samples = decode_audio(audio_file, sample_format="s16", layout=None, rate=None)
+            return AudioSegment(samples.tobytes(), sample_width=2, frame_rate=rate, channels=channels)
+        except Exception as e:
+            print(f"⚠️  PyAV decode failed ({e}), loading with pydub")
+    
+    # Support both wav and mp3 input
+    if audio_file.endswith('.mp3'):
+        return AudioSegment.from_mp3(audio_file)
+    return AudioSegment.from_wav(audio_file)
+
+
+def _remove_silence_pydub(audio_file: str, output_file: str,
+                          min_silence_len: int, silence_thresh: int,
+                          keep_silence: int) -> str:
+    """Last-resort silence removal that decodes the whole file into memory with pydub."""
+    print("Loading audio file...")
+    audio = load_audio_segment(audio_file)
+    
+    print("Removing silence...")
+    if NUMPY_AVAILABLE:
+        # Same chunking as split_on_silence, but with vectorized detection
+        ranges = [[start - keep_silence, end + keep_silence]
+                  for start, end in fast_detect_nonsilent(audio, min_silence_len, silence_thresh)]
+        for prev, nxt in zip(ranges, ranges[1:]):
+            if nxt[0] < prev[1]:
+                prev[1] = nxt[0] = (prev[1] + nxt[0]) // 2
+        chunks = [audio[max(start, 0):min(end, len(audio))] for start, end in ranges]
     else:
-        # Use ffmpeg directly for silence removal
-        print("Using ffmpeg for silence removal...")
-        # ffmpeg filter to remove silence
-        # silenceremove=start_periods=1:start_duration=1:start_threshold=-40dB:detection=peak
-        # aformat=dblp,areverse,silenceremove=start_periods=1:start_duration=1:start_threshold=-40dB:detection=peak,aformat=dblp,areverse
-        
-        # Convert threshold from dB to linear scale for ffmpeg
-        # ffmpeg uses -50dB to -20dB range typically
-        threshold_db = silence_thresh
+        # Split on silence
+        chunks = split_on_silence(
+            audio,
+            min_silence_len=min_silence_len,
+            silence_thresh=silence_thresh,
+            keep_silence=keep_silence
+        )
+    
+    if not chunks:
+        print("No audio chunks found. Using original audio.")
+        # Export as MP3 with very low bitrate to save space (32kbps for speech)
+        audio.export(output_file, format="mp3", bitrate="32k")
+        return output_file
+    
+    original_ms = len(audio)
+    processed_ms = sum(len(chunk) for chunk in chunks)
+    print(f"Original duration: {original_ms / 1000:.1f}s")
+    print(f"After silence removal: {processed_ms / 1000:.1f}s")
+    if original_ms > 0:
+        reduction_pct = ((original_ms - processed_ms) / original_ms) * 100
+        print(f"Reduction: {reduction_pct:.1f}%")
+    else:
+        print("Reduction: 0.0%")
+    
+    # Combine all non-silent chunks with ffmpeg's concat demuxer rather than
+    # repeated AudioSegment +=, which copies the growing buffer on every chunk
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manifest = os.path.join(tmp_dir, "concat.txt")
+        with open(manifest, "w", encoding="utf-8") as f:
+            for i, chunk in enumerate(chunks):
+                chunk_file = os.path.join(tmp_dir, f"chunk_{i}.wav")
+                chunk.export(chunk_file, format="wav")
+                f.write(concat_manifest_entry(chunk_file))
         
-        # Use MP3 format with very low bitrate (32kbps) to save space
+        # Export as MP3 with very low bitrate (32kbps) to save space
         cmd = [
-            'ffmpeg', '-i', audio_file,
-            '-af', f'silenceremove=start_periods=1:start_duration={min_silence_len/1000}:start_threshold={threshold_db}dB:detection=peak',
+            'ffmpeg', '-f', 'concat', '-safe', '0', '-i', manifest,
             '-acodec', 'libmp3lame',
-            '-ab', '32k',  # 32kbps bitrate for speech (maximum space savings)
-            '-ar', '16000',  # Lower sample rate for speech (saves more space)
+            '-ab', '32k',
             '-y',  # Overwrite output file
             output_file
         ]
-        
-        try:
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
-            print(f"Silence removed using ffmpeg")
-            print(f"Saved processed audio to: {output_file}")
-            return output_file
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️  FFmpeg silence removal failed: {e.stderr}")
-            print("   Copying original audio file...")
-            shutil.copy2(audio_file, output_file)
-            return output_file
-        except FileNotFoundError:
-            print("⚠️  FFmpeg not found. Copying original audio file...")
-            print("   Install ffmpeg: brew install ffmpeg")
-            shutil.copy2(audio_file, output_file)
-            return output_file
+        subprocess.run(cmd, capture_output=True, text=True, check=True)
+    
+    print(f"Saved processed audio to: {output_file}")
+    return output_file
+
+
+def select_whisper_device() -> Tuple[str, str]:
+    """
+    Pick the faster-whisper device and compute type.
+    
+    Returns:
+        ("cuda", "int8_float16") when ctranslate2 sees a CUDA device, else ("cpu", "int8")
+    """
+    try:
+        import ctranslate2
+        if ctranslate2.get_cuda_device_count() > 0:
+            return "cuda", "int8_float16"
+    except Exception:
+        pass
+    return "cpu", "int8"
+
+
+# Every Whisper backend consumes 16 kHz mono float32 audio
+WHISPER_SAMPLE_RATE = 16000
+
+
+def decode_audio(audio_file: str, sample_format: str = "flt", layout: Optional[str] = "mono",
+                 rate: Optional[int] = WHISPER_SAMPLE_RATE) -> "np.ndarray":
+    """
+    Decode an audio file in-process with PyAV into a packed NumPy array.
+    
+    Args:
+        audio_file: Input audio file path
+        sample_format: PyAV sample format to convert to (e.g. 'flt', 's16')
+        layout: Channel layout to convert to, or None to keep the source layout
+        rate: Sample rate to resample to, or None to keep the source rate
+    
+    Returns:
+        1-D array of interleaved samples
+    """
+    with av.open(audio_file) as container:
+        stream = container.streams.audio[0]
+        resampler = av.AudioResampler(format=sample_format, layout=layout, rate=rate)
+        chunks = []
+        for frame in container.decode(stream):
+            for resampled in resampler.resample(frame):
+                chunks.append(resampled.to_ndarray().reshape(-1))
+        # Flush samples buffered inside the resampler
+        for resampled in resampler.resample(None):
+            chunks.append(resampled.to_ndarray().reshape(-1))
+    if not chunks:
+        return np.zeros(0, dtype=np.float32 if sample_format == "flt" else np.int16)
+    return np.concatenate(chunks)
+
+
+def load_whisper_audio(audio_file: str):
+    """
+    Decode audio once into the 16 kHz mono float32 array Whisper expects.
+    
+    Backends accept the array directly, so none of them has to open and resample
+    the file again. Long near-silent stretches are dropped by energy_gate unless
+    faster-whisper's VAD will skip them.
+    
+    Returns:
+        (audio, runs): the samples, or the path unchanged if PyAV/NumPy are
+        unavailable, and energy_gate's kept-run map, or None if the gate was
+        skipped or dropped nothing
+    """
+    if not (AV_AVAILABLE and NUMPY_AVAILABLE):
+        return audio_file, None
+    try:
+        samples = decode_audio(audio_file)
+    except Exception as e:
+        print(f"⚠️  Could not pre-decode audio ({e}), letting Whisper decode it")
+        return audio_file, None
+    
+    if SILENCE_BACKEND == "whisper_vad":
+        # faster-whisper's VAD already skips non-speech at the feature level
+        return samples, None
+    
+    filtered, runs = energy_gate(samples)
+    if len(samples) > 0:
+        reduction_pct = ((len(samples) - len(filtered)) / len(samples)) * 100
+        print(f"Energy gate reduction: {reduction_pct:.1f}%")
+    return filtered, runs
 
 
-def transcribe_audio(audio_file: str, model_name: str = "base") -> Optional[list[dict]]:
+def energy_gate(samples: "np.ndarray", frame_len: int = 320, threshold_db: float = -50.0,
+                min_quiet_frames: int = 10) -> Tuple["np.ndarray", Optional["np.ndarray"]]:
     """
-    Transcribe audio using Whisper.
+    Drop long near-silent stretches before they reach Whisper.
+    
+    Cuts float samples into frame_len windows (20 ms at 16 kHz) and drops runs of at
+    least min_quiet_frames consecutive windows whose RMS is at or below threshold_db
+    dBFS (200 ms by default). Whisper is slow on empty audio and tends to hallucinate
+    text there; short pauses inside speech are kept. A trailing partial frame is
+    always kept.
     
     Returns:
-        List of segments with 'start', 'end', and 'text' keys, or None if transcription unavailable
+        (filtered, runs): the kept samples, and one (original start, gated start)
+        sample offset per kept run, for mapping timestamps back with gated_to_original.
+        runs is None when nothing was dropped, as no timestamps need mapping.
+    """
+    usable = len(samples) - len(samples) % frame_len
+    frames = samples[:usable].reshape(-1, frame_len)
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    quiet = rms <= 10 ** (threshold_db / 20)
+    
+    # Boundaries of every quiet run, as [start, end) frame indices
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], quiet, [False])).astype(np.int8)))
+    quiet_starts, quiet_ends = edges[::2], edges[1::2]
+    long_runs = quiet_ends - quiet_starts >= min_quiet_frames
+    drop_starts = quiet_starts[long_runs] * frame_len
+    drop_ends = quiet_ends[long_runs] * frame_len
+    
+    # Kept runs are the gaps between dropped runs
+    keep_starts = np.concatenate(([0], drop_ends))
+    keep_ends = np.concatenate((drop_starts, [len(samples)]))
+    nonempty = keep_ends > keep_starts
+    keep_starts, keep_ends = keep_starts[nonempty], keep_ends[nonempty]
+    
+    if len(keep_starts) == 1 and keep_ends[0] - keep_starts[0] == len(samples):
+        return samples, None
+    lengths = keep_ends - keep_starts
+    gated_starts = np.cumsum(lengths) - lengths
+    runs = np.column_stack((keep_starts, gated_starts))
+    filtered = np.concatenate([samples[start:end] for start, end in zip(keep_starts, keep_ends)]
+                              or [samples[:0]])
+    return filtered, runs
+
+
+def gated_to_original(seconds: float, runs: "np.ndarray", side: str = "right") -> float:
+    """
+    Map a time in energy-gated audio back to the audio it was cut from.
+    
+    side="right" suits segment starts; side="left" keeps an end that falls exactly
+    on a cut inside the run it closes rather than at the start of the next one.
+    """
+    if len(runs) == 0:
+        return seconds
+    gated = seconds * WHISPER_SAMPLE_RATE
+    index = max(int(np.searchsorted(runs[:, 1], gated, side=side)) - 1, 0)
+    original_start, gated_start = runs[index]
+    return float(original_start + (gated - gated_start)) / WHISPER_SAMPLE_RATE
+
+
+@lru_cache(maxsize=2)
+def _get_whisper_model(model_name: str, device: Optional[str] = None,
+                       compute_type: Optional[str] = None):
+    """Load a Whisper model once per process so batch runs reuse the weights."""
+    if WHISPER_TYPE == "cpp":
+        print(f"Loading whisper.cpp model ({model_name})...")
+        return WhisperCppModel(model_name, n_threads=os.cpu_count() or 4)
+    
+    if WHISPER_TYPE == "faster":
+        print(f"Loading Faster Whisper model ({model_name}, {device}/{compute_type})...")
+        return WhisperModel(model_name, device=device, compute_type=compute_type,
+                            cpu_threads=os.cpu_count() or 0, num_workers=1)
+    
+    print(f"Loading Whisper model ({model_name})...")
+    return whisper.load_model(model_name)
+
+
+def transcribe_audio(audio_file: str, sink_path: str, model_name: str = "base"
+                     ) -> Optional[Tuple[list[float], list[float], list[str]]]:
+    """
+    Transcribe audio using Whisper, streaming segments to sink_path as they are decoded.
+    
+    The sink is a compact JSON array with one segment per line, each with 'start',
+    'end' and 'text' keys. If transcription is interrupted, the segments decoded
+    so far remain on disk.
+    
+    Returns:
+        (starts, ends, texts) columns of the segments written, collected on the way
+        so the summary needs no reload, or None if transcription unavailable
     """
     if not WHISPER_AVAILABLE:
         print("⚠️  Whisper not available. Skipping transcription.")
         print("   To enable transcription, install: pip install openai-whisper")
-        print("   Or use: pip install faster-whisper")
+        print("   Or use: pip install faster-whisper (or pywhispercpp)")
         return None
     
     try:
-        if WHISPER_TYPE == "faster":
-            print(f"Loading Faster Whisper model ({model_name})...")
-            from faster_whisper import WhisperModel
-            model = WhisperModel(model_name, device="cpu", compute_type="int8")
+        audio, runs = load_whisper_audio(audio_file)
+        
+        if WHISPER_TYPE == "cpp":
+            model = _get_whisper_model(model_name)
             
             print("Transcribing audio...")
-            segments_gen, _ = model.transcribe(audio_file, word_timestamps=False)
+            # whisper.cpp reports times in centiseconds; token timestamps stay off
+            segments = (
+                {"start": segment.t0 / 100, "end": segment.t1 / 100, "text": segment.text.strip()}
+                for segment in model.transcribe(audio)
+            )
+        elif WHISPER_TYPE == "faster":
+            device, compute_type = select_whisper_device()
+            model = _get_whisper_model(model_name, device, compute_type)
             
-            segments = []
-            for segment in segments_gen:
-                segments.append({
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text.strip()
-                })
+            print("Transcribing audio...")
+            # Lazy generator - segments arrive as the model decodes them.
+            # The built-in Silero VAD skips non-speech, replacing the silence-removal step.
+            segments_gen, _ = model.transcribe(audio, word_timestamps=False, vad_filter=True,
+                                               vad_parameters={"min_silence_duration_ms": 500})
+            segments = (
+                {"start": segment.start, "end": segment.end, "text": segment.text.strip()}
+                for segment in segments_gen
+            )
         else:
-            print(f"Loading Whisper model ({model_name})...")
-            model = whisper.load_model(model_name)
+            model = _get_whisper_model(model_name)
             
             print("Transcribing audio...")
-            result = model.transcribe(audio_file, word_timestamps=False)
-            
-            segments = []
-            for segment in result["segments"]:
-                segments.append({
-                    "start": segment["start"],
-                    "end": segment["end"],
-                    "text": segment["text"].strip()
-                })
+            result = model.transcribe(audio, word_timestamps=False)
+            segments = (
+                {"start": segment["start"], "end": segment["end"], "text": segment["text"].strip()}
+                for segment in result["segments"]
+            )
+        
+        starts, ends, texts = [], [], []
+        with open(sink_path, "wb") as f:
+            f.write(b"[")
+            for segment in segments:
+                if runs is not None:
+                    # Times refer to the gated audio; report them against audio_file
+                    segment["start"] = gated_to_original(segment["start"], runs)
+                    segment["end"] = gated_to_original(segment["end"], runs, side="left")
+                f.write(b",\n" if texts else b"\n")
+                f.write(json_dumps(segment))
+                starts.append(segment["start"])
+                ends.append(segment["end"])
+                texts.append(segment["text"])
+            f.write(b"\n]")
         
-        print(f"Transcribed {len(segments)} segments")
-        return segments
+        print(f"Transcribed {len(texts)} segments")
+        return starts, ends, texts
     except Exception as e:
         print(f"⚠️  Transcription failed: {e}")
         print("   Continuing without transcription...")
         return None
 
 
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes, with orjson when available.
+    
+    Output is compact unless indent is set; indentation is only worth it for small,
+    human-read files like the checkpoint.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: bytes):
+    """Parse UTF-8 JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_transcription(transcription_file: str) -> list[dict]:
+    """Load transcription segments saved by transcribe_audio."""
+    with open(transcription_file, "rb") as f:
+        return json_loads(f.read())
+
+
 def load_checkpoint(video_folder: str) -> Dict:
     """Load checkpoint file if it exists."""
     checkpoint_file = os.path.join(video_folder, ".checkpoint.json")
     if os.path.exists(checkpoint_file):
         try:
-            with open(checkpoint_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(checkpoint_file, "rb") as f:
+                return json_loads(f.read())
         except Exception:
             return {}
     return {}
@@ -253,212 +944,323 @@ def save_checkpoint(video_folder: str, state: Dict):
     """Save checkpoint file with current state."""
     checkpoint_file = os.path.join(video_folder, ".checkpoint.json")
     try:
-        with open(checkpoint_file, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2, ensure_ascii=False)
+        with open(checkpoint_file, "wb") as f:
+            f.write(json_dumps(state, indent=True))
     except Exception as e:
         print(f"Warning: Could not save checkpoint: {e}")
 
 
-def generate_summary(segments: list[dict], title: str) -> str:
-    """Generate a highlight summary from transcription segments."""
-    if not segments:
+def highlight_boundaries(starts: Sequence[float], ends: Sequence[float],
+                         interval: float) -> list[int]:
+    """
+    Return the index of the first segment of every highlight.
+    
+    A new highlight starts whenever the gap since the previous segment ended
+    exceeds interval seconds.
+    """
+    if not starts:
+        return []
+    if NUMPY_AVAILABLE:
+        starts = np.asarray(starts, dtype=np.float64)
+        ends = np.asarray(ends, dtype=np.float64)
+        breaks = np.flatnonzero(starts[1:] - ends[:-1] > interval) + 1
+        return [0] + breaks.tolist()
+    return [0] + [i for i in range(1, len(starts)) if starts[i] - ends[i - 1] > interval]
+
+
+def format_timestamp(seconds: float) -> str:
+    """Format a time offset as MM:SS (minutes are not wrapped into hours)."""
+    minutes, secs = divmod(int(seconds), 60)
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def generate_summary(segments: Iterable[dict], title: str) -> str:
+    """
+    Generate a highlight summary from transcription segments.
+    
+    segments may be any iterable; it is consumed in a single pass.
+    """
+    # Keep only the columns the summary needs rather than the segment dicts
+    starts, ends, texts = [], [], []
+    for segment in segments:
+        if 'end' not in segment:
+            return f"# Video Summary: {title}\n\nInvalid transcription data."
+        starts.append(segment["start"])
+        ends.append(segment["end"])
+        texts.append(segment["text"])
+    return generate_summary_from_columns(starts, ends, texts, title)
+
+
+def generate_summary_from_columns(starts: Sequence[float], ends: Sequence[float],
+                                  texts: Sequence[str], title: str) -> str:
+    """Generate a highlight summary from parallel start/end/text columns."""
+    if not texts:
         return f"# Video Summary: {title}\n\nNo transcription available."
     
     # Calculate total duration
-    if 'end' not in segments[-1]:
-        return f"# Video Summary: {title}\n\nInvalid transcription data."
+    total_duration = ends[-1]
+    hours, remainder = divmod(int(total_duration), 3600)
+    minutes, seconds = divmod(remainder, 60)
     
-    total_duration = segments[-1]['end']
-    hours = int(total_duration // 3600)
-    minutes = int((total_duration % 3600) // 60)
-    seconds = int(total_duration % 60)
+    # Build the summary in a single growable buffer
+    summary = io.StringIO()
+    write = summary.write
     
     # Create summary with timestamps for key points
-    summary_lines = [f"# Video Summary: {title}\n\n"]
-    summary_lines.append(f"**Total Duration:** {hours:02d}:{minutes:02d}:{seconds:02d}\n")
-    summary_lines.append(f"**Total Segments:** {len(segments)}\n\n")
+    write(f"# Video Summary: {title}\n\n")
+    write(f"**Total Duration:** {hours:02d}:{minutes:02d}:{seconds:02d}\n")
+    write(f"**Total Segments:** {len(texts)}\n\n")
     
-    summary_lines.append("## 🎯 Key Highlights\n\n")
+    write("## 🎯 Key Highlights\n\n")
     
-    # Create highlights by grouping segments intelligently
-    # Group segments that are close together and create highlights every ~60 seconds
+    # Group segments that are close together; a gap of more than ~60 seconds
+    # starts a new highlight. Boundaries are found in one vectorized scan, then
+    # text is joined once per highlight.
     highlight_interval = 60  # seconds
-    current_time = 0
-    highlight_count = 0
-    current_highlight_text = []
-    current_highlight_start = 0
-    
-    for i, segment in enumerate(segments):
-        # Start a new highlight if enough time has passed or at the beginning
-        if segment["start"] - current_time > highlight_interval or i == 0:
-            # Save previous highlight if it exists
-            if current_highlight_text and i > 0:
-                minutes_start = int(current_highlight_start // 60)
-                seconds_start = int(current_highlight_start % 60)
-                minutes_end = int(current_time // 60)
-                seconds_end = int(current_time % 60)
-                highlight_text = " ".join(current_highlight_text)
-                summary_lines.append(
-                    f"### [{minutes_start:02d}:{seconds_start:02d} - {minutes_end:02d}:{seconds_end:02d}] "
-                    f"Highlight {highlight_count}\n\n"
-                )
-                summary_lines.append(f"{highlight_text}\n\n")
-                highlight_count += 1
-            
-            # Start new highlight
-            current_highlight_text = [segment["text"]]
-            current_highlight_start = segment["start"]
-            current_time = segment["end"]
-        else:
-            # Add to current highlight
-            current_highlight_text.append(segment["text"])
-            current_time = segment["end"]
-    
-    # Don't forget the last highlight
-    if current_highlight_text:
-        minutes_start = int(current_highlight_start // 60)
-        seconds_start = int(current_highlight_start % 60)
-        minutes_end = int(segments[-1]["end"] // 60)
-        seconds_end = int(segments[-1]["end"] % 60)
-        highlight_text = " ".join(current_highlight_text)
-        summary_lines.append(
-            f"### [{minutes_start:02d}:{seconds_start:02d} - {minutes_end:02d}:{seconds_end:02d}] "
-            f"Highlight {highlight_count + 1}\n\n"
-        )
-        summary_lines.append(f"{highlight_text}\n\n")
+    boundaries = highlight_boundaries(starts, ends, highlight_interval)
+    for number, (first, last) in enumerate(zip(boundaries, boundaries[1:] + [len(texts)]), start=1):
+        write(f"### [{format_timestamp(starts[first])} - {format_timestamp(ends[last - 1])}] "
+              f"Highlight {number}\n\n")
+        write(" ".join(texts[first:last]))
+        write("\n\n")
     
     # Add full transcription
-    summary_lines.append("---\n\n")
-    summary_lines.append("## 📝 Full Transcription\n\n")
-    for segment in segments:
-        minutes = int(segment["start"] // 60)
-        seconds = int(segment["start"] % 60)
-        summary_lines.append(f"**[{minutes:02d}:{seconds:02d}]** {segment['text']}\n\n")
+    write("---\n\n")
+    write("## 📝 Full Transcription\n\n")
+    for start, text in zip(starts, texts):
+        write(f"**[{format_timestamp(start)}]** {text}\n\n")
     
-    return "".join(summary_lines)
+    return summary.getvalue()
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python process_video.py <youtube_url>")
-        sys.exit(1)
+def prepare_video(url: str, downloads_dir: str = "downloads", videos_dir: str = "videos") -> Dict:
+    """
+    Download one video and set up its folder and checkpoint.
     
-    url = sys.argv[1]
+    This is the network-bound stage; finish_video does the CPU/GPU-bound rest.
     
-    # Base directories
-    downloads_dir = "downloads"
-    videos_dir = "videos"
-    Path(downloads_dir).mkdir(exist_ok=True)
-    Path(videos_dir).mkdir(exist_ok=True)
+    Returns:
+        Job dict consumed by finish_video
+    """
+    # Step 1: Download video (with auto-save check)
+    audio_file, title, silence_removed = download_video(
+        url, downloads_dir, fuse_silence_removal=SILENCE_BACKEND == "ffmpeg")
     
-    try:
-        # Step 1: Download video (with auto-save check)
-        audio_file, title = download_video(url, downloads_dir)
-        
-        # Sanitize title for folder and filenames
-        safe_title = sanitize_filename(title)
-        
-        # Create a dedicated folder for this video in the videos/ directory
-        video_folder = os.path.join(videos_dir, safe_title)
-        Path(video_folder).mkdir(exist_ok=True)
-        
-        # Create subdirectories for organization
-        audio_dir = os.path.join(video_folder, "audio")
-        summaries_dir = os.path.join(video_folder, "summaries")
-        transcriptions_dir = os.path.join(video_folder, "transcriptions")
-        
-        Path(audio_dir).mkdir(exist_ok=True)
-        Path(summaries_dir).mkdir(exist_ok=True)
-        Path(transcriptions_dir).mkdir(exist_ok=True)
-        
-        # Load checkpoint to see what's already done
-        checkpoint = load_checkpoint(video_folder)
-        processed_audio = os.path.join(audio_dir, f"{safe_title}_processed_audio.mp3")
-        transcription_file = os.path.join(transcriptions_dir, f"{safe_title}_transcription.json")
-        summary_file = os.path.join(summaries_dir, f"{safe_title}_summary.md")
-        
-        print(f"\n📁 Folder: {video_folder}/")
-        
-        # Update checkpoint - download complete
-        checkpoint['downloaded'] = True
-        checkpoint['url'] = url
-        checkpoint['title'] = title
+    # Sanitize title for folder and filenames
+    safe_title = sanitize_filename(title)
+    
+    # Create a dedicated folder for this video in the videos/ directory
+    video_folder = os.path.join(videos_dir, safe_title)
+    Path(video_folder).mkdir(exist_ok=True)
+    
+    # Create subdirectories for organization
+    audio_dir = os.path.join(video_folder, "audio")
+    summaries_dir = os.path.join(video_folder, "summaries")
+    transcriptions_dir = os.path.join(video_folder, "transcriptions")
+    
+    Path(audio_dir).mkdir(exist_ok=True)
+    Path(summaries_dir).mkdir(exist_ok=True)
+    Path(transcriptions_dir).mkdir(exist_ok=True)
+    
+    # Load checkpoint to see what's already done
+    checkpoint = load_checkpoint(video_folder)
+    processed_audio = os.path.join(audio_dir, f"{safe_title}_processed_audio.mp3")
+    transcription_file = os.path.join(transcriptions_dir, f"{safe_title}_transcription.json")
+    summary_file = os.path.join(summaries_dir, f"{safe_title}_summary.md")
+    
+    # Update checkpoint - download complete
+    checkpoint['downloaded'] = True
+    checkpoint['url'] = url
+    checkpoint['title'] = title
+    save_checkpoint(video_folder, checkpoint)
+    
+    return {
+        'url': url,
+        'title': title,
+        'safe_title': safe_title,
+        'audio_file': audio_file,
+        'silence_removed': silence_removed,
+        'video_folder': video_folder,
+        'checkpoint': checkpoint,
+        'processed_audio': processed_audio,
+        'transcription_file': transcription_file,
+        'summary_file': summary_file,
+    }
+
+
+def finish_video(job: Dict):
+    """Remove silence, transcribe and summarize a video prepared by prepare_video."""
+    title = job['title']
+    safe_title = job['safe_title']
+    audio_file = job['audio_file']
+    silence_removed = job['silence_removed']
+    video_folder = job['video_folder']
+    checkpoint = job['checkpoint']
+    processed_audio = job['processed_audio']
+    transcription_file = job['transcription_file']
+    summary_file = job['summary_file']
+    
+    print(f"\n📁 Folder: {video_folder}/")
+    
+    # Step 2: Remove silence (with auto-save check)
+    if os.path.exists(processed_audio) and checkpoint.get('silence_removed', False):
+        print("✓ Silence removal already completed (using existing file)")
+    elif silence_removed or SILENCE_BACKEND == "whisper_vad":
+        # The download was filtered and encoded in a single ffmpeg pass, or Whisper's
+        # VAD will skip silence itself and the encoded download is used as is
+        shutil.move(audio_file, processed_audio)
+        checkpoint['silence_removed'] = True
         save_checkpoint(video_folder, checkpoint)
-        
-        # Step 2: Remove silence (with auto-save check)
-        if os.path.exists(processed_audio) and checkpoint.get('silence_removed', False):
-            print("✓ Silence removal already completed (using existing file)")
-        else:
-            print("🔄 Removing silence from audio...")
-            remove_silence(audio_file, processed_audio)
-            checkpoint['silence_removed'] = True
-            save_checkpoint(video_folder, checkpoint)
+        if silence_removed:
             print("✓ Silence removal saved")
-        
-        # Step 3: Transcribe (with auto-save check)
-        segments = None
-        if os.path.exists(transcription_file) and checkpoint.get('transcribed', False):
-            print("✓ Transcription already completed (loading existing file)")
-            try:
-                with open(transcription_file, "r", encoding="utf-8") as f:
-                    segments = json.load(f)
-                print(f"✓ Loaded {len(segments)} segments from saved transcription")
-            except Exception as e:
-                print(f"⚠️  Could not load saved transcription: {e}")
-                print("🔄 Re-transcribing...")
-                segments = transcribe_audio(processed_audio)
         else:
-            print("🔄 Transcribing audio...")
-            segments = transcribe_audio(processed_audio)
-        
-        if segments:
-            # Auto-save transcription immediately
-            with open(transcription_file, "w", encoding="utf-8") as f:
-                json.dump(segments, f, indent=2, ensure_ascii=False)
+            print("✓ Audio saved (silence is skipped by Whisper's VAD)")
+    else:
+        print("🔄 Removing silence from audio...")
+        remove_silence(audio_file, processed_audio)
+        checkpoint['silence_removed'] = True
+        save_checkpoint(video_folder, checkpoint)
+        print("✓ Silence removal saved")
+    
+    # Step 3: Transcribe (with auto-save check)
+    segments = None  # Saved segments, only loaded when resuming
+    columns = None  # (starts, ends, texts) collected while transcribing
+    if os.path.exists(transcription_file) and checkpoint.get('transcribed', False):
+        print("✓ Transcription already completed (loading existing file)")
+        try:
+            segments = load_transcription(transcription_file)
+            print(f"✓ Loaded {len(segments)} segments from saved transcription")
+        except Exception as e:
+            print(f"⚠️  Could not load saved transcription: {e}")
+            print("🔄 Re-transcribing...")
+    else:
+        print("🔄 Transcribing audio...")
+    
+    if segments is None:
+        # Segments are auto-saved to transcription_file as they are decoded
+        columns = transcribe_audio(processed_audio, transcription_file)
+        if columns and columns[2]:
             checkpoint['transcribed'] = True
             save_checkpoint(video_folder, checkpoint)
             print(f"✓ Transcription auto-saved to: {transcription_file}")
-            
-            # Step 4: Generate summary (with auto-save check)
-            if os.path.exists(summary_file) and checkpoint.get('summary_generated', False):
-                print("✓ Summary already generated (using existing file)")
+        else:
+            columns = None
+    
+    transcribed = bool(segments) or columns is not None
+    if transcribed:
+        # Step 4: Generate summary (with auto-save check)
+        if os.path.exists(summary_file) and checkpoint.get('summary_generated', False):
+            print("✓ Summary already generated (using existing file)")
+        else:
+            print("🔄 Generating summary...")
+            if columns is not None:
+                summary = generate_summary_from_columns(*columns, title)
             else:
-                print("🔄 Generating summary...")
                 summary = generate_summary(segments, title)
-                with open(summary_file, "w", encoding="utf-8") as f:
-                    f.write(summary)
-                checkpoint['summary_generated'] = True
-                save_checkpoint(video_folder, checkpoint)
-                print(f"✓ Summary auto-saved to: {summary_file}")
-        else:
-            print("\n⚠️  Transcription skipped. Audio processing complete.")
-            print("   Install whisper to enable transcription:")
-            print("   pip install openai-whisper")
-        
-        # Mark as complete
-        checkpoint['completed'] = True
-        save_checkpoint(video_folder, checkpoint)
-        
-        print("\n✅ Processing complete!")
-        print(f"📁 All files organized in: {video_folder}/")
-        print(f"   ├── audio/{safe_title}_processed_audio.mp3 (compressed, 32kbps)")
-        if segments:
-            print(f"   ├── transcriptions/{safe_title}_transcription.json")
-            print(f"   └── summaries/{safe_title}_summary.md")
-        print(f"\n💾 Auto-save enabled - all progress saved automatically")
-        
+            with open(summary_file, "w", encoding="utf-8") as f:
+                f.write(summary)
+            checkpoint['summary_generated'] = True
+            save_checkpoint(video_folder, checkpoint)
+            print(f"✓ Summary auto-saved to: {summary_file}")
+    else:
+        print("\n⚠️  Transcription skipped. Audio processing complete.")
+        print("   Install whisper to enable transcription:")
+        print("   pip install openai-whisper")
+    
+    # Mark as complete
+    checkpoint['completed'] = True
+    save_checkpoint(video_folder, checkpoint)
+    
+    print("\n✅ Processing complete!")
+    print(f"📁 All files organized in: {video_folder}/")
+    print(f"   ├── audio/{safe_title}_processed_audio.mp3 (compressed, 32kbps)")
+    if transcribed:
+        print(f"   ├── transcriptions/{safe_title}_transcription.json")
+        print(f"   └── summaries/{safe_title}_summary.md")
+    print(f"\n💾 Auto-save enabled - all progress saved automatically")
+
+
+def process_url(url: str, downloads_dir: str = "downloads", videos_dir: str = "videos"):
+    """Download, clean, transcribe and summarize one video, resuming from its checkpoint."""
+    finish_video(prepare_video(url, downloads_dir, videos_dir))
+
+
+def _report_failure(url: str, e: Exception):
+    """Print a failed URL's error without stopping the rest of the batch."""
+    print(f"❌ Error processing {url}: {e}", file=sys.stderr)
+    import traceback
+    traceback.print_exception(type(e), e, e.__traceback__)
+
+
+def _download_worker(urls: list[str], downloads_dir: str, videos_dir: str,
+                     jobs: "queue.Queue[Optional[Dict]]"):
+    """
+    Download every URL in order, handing prepared jobs to the main thread.
+    
+    Every URL yields exactly one item, in order; a failed download is passed on as
+    {'url': ..., 'error': ...} so the main thread reports it. None marks the end of
+    the batch.
+    """
+    for url in urls:
+        try:
+            jobs.put(prepare_video(url, downloads_dir, videos_dir))
+        except Exception as e:
+            jobs.put({'url': url, 'error': e})
+    jobs.put(None)
+
+
+def process_batch(urls: list[str], downloads_dir: str = "downloads", videos_dir: str = "videos") -> int:
+    """
+    Process several videos in one run.
+    
+    The Whisper model is loaded once and reused for every URL. A daemon thread
+    downloads ahead through a bounded queue while the main thread transcribes, so
+    the next video downloads during the current transcription and Ctrl+C still
+    stops the run at once. A failing URL is reported and skipped so the rest of
+    the batch still runs.
+    
+    Returns:
+        Number of URLs that failed
+    """
+    Path(downloads_dir).mkdir(exist_ok=True)
+    Path(videos_dir).mkdir(exist_ok=True)
+    
+    jobs: "queue.Queue[Optional[Dict]]" = queue.Queue(maxsize=2)
+    threading.Thread(target=_download_worker, args=(urls, downloads_dir, videos_dir, jobs),
+                     daemon=True).start()
+    
+    failed = 0
+    for index, job in enumerate(iter(jobs.get, None), start=1):
+        # Printed here rather than in the worker, so it heads this video's own log
+        print(f"\n🎬 [{index}/{len(urls)}] {job['url']}")
+        if 'error' in job:
+            _report_failure(job['url'], job['error'])
+            failed += 1
+            continue
+        try:
+            finish_video(job)
+        except Exception as e:
+            _report_failure(job['url'], e)
+            failed += 1
+    return failed
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python process_video.py <youtube_url> [<youtube_url> ...]")
+        sys.exit(1)
+    
+    try:
+        failed = process_batch(sys.argv[1:])
     except KeyboardInterrupt:
         print("\n\n⚠️  Process interrupted by user")
         print("💾 Progress has been auto-saved. Run the script again to resume.")
         sys.exit(0)
-    except Exception as e:
-        print(f"❌ Error: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
+    
+    if failed:
         print("\n💾 Progress has been auto-saved. Fix the error and run again to resume.")
         sys.exit(1)
 
 
 if __name__ == "__main__":
     main()
-